@@ -1 +1,2 @@
+from .prefork import MemoryUsage, memory_usage, warmup
 from .validator import validated
@@ -0,0 +1,87 @@
+import gc
+import pathlib
+import warnings
+from typing import Dict, List, NamedTuple, Optional
+
+import pydantic
+
+from . import validator
+
+SMAPS_ROLLUP_PATH = pathlib.Path('/proc/self/smaps_rollup')
+
+
+class MemoryUsage(NamedTuple):
+    shared: int
+    private: int
+
+
+def memory_usage() -> Optional[MemoryUsage]:
+    """
+    Returns the current process shared and private memory in bytes.
+
+    Intended to be called in forked workers to check how much of the parent memory is still shared.
+    Works on Linux only (reads `/proc/self/smaps_rollup`), on other platforms returns `None`.
+
+    :return: process memory usage
+    """
+
+    try:
+        lines = SMAPS_ROLLUP_PATH.read_text().splitlines()
+    except OSError:
+        return None
+
+    stats: Dict[str, int] = {}
+    for line in lines:
+        key, sep, value = line.partition(':')
+        fields = value.split()
+        if sep and len(fields) == 2 and fields[1] == 'kB':
+            stats[key] = int(fields[0]) * 1024
+
+    return MemoryUsage(
+        shared=stats.get('Shared_Clean', 0) + stats.get('Shared_Dirty', 0),
+        private=stats.get('Private_Clean', 0) + stats.get('Private_Dirty', 0),
+    )
+
+
+def warmup(freeze: bool = True) -> int:
+    """
+    Prepares validated handlers for a pre-forking deployment.
+
+    Should be called in the parent process after all the handlers are imported and right before the workers
+    are forked. Completes building of all the params, body, headers and cookies models, runs a synthetic
+    validation of an empty input per model (a smoke test only: field validators are not reached if the model
+    has required fields) and, if `freeze` is set, moves all the tracked objects to the permanent gc generation
+    so that the memory pages they occupy are shared by the workers copy-on-write.
+    Models nested in the handler models (fields, including generic arguments like `List[Model]`) are warmed up too.
+    Models that can't be built (unresolved forward references, for example) are skipped and models failing
+    the synthetic validation with an error other than a validation one are reported with a warning.
+
+    :param freeze: freeze the gc after warmup
+    :return: number of warmed up models
+    """
+
+    warmed_up = 0
+    incomplete: List[str] = []
+    failed: List[str] = []
+    for model in list(validator.registered_models):
+        if model.model_rebuild(raise_errors=False) is False:
+            incomplete.append(model.__qualname__)
+            continue
+
+        try:
+            model.model_validate({})
+        except pydantic.ValidationError:
+            pass
+        except Exception:
+            failed.append(model.__qualname__)
+        warmed_up += 1
+
+    if incomplete:
+        warnings.warn(f"models can't be built: {', '.join(sorted(incomplete))}", RuntimeWarning)
+    if failed:
+        warnings.warn(f"models synthetic validation failed: {', '.join(sorted(failed))}", RuntimeWarning)
+
+    if freeze:
+        gc.freeze()
+
+    return warmed_up
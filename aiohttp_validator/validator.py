@@ -2,6 +2,7 @@ import functools as ft
 import inspect
 import json
 import typing
+import weakref
 from collections import defaultdict
 from typing import Any, Callable, Coroutine, Dict, List, Mapping, NamedTuple, Optional, Type, Union
 
@@ -146,6 +147,27 @@ async def process_cookes(request: web.Request, cookies_annotation: Any) -> Cooki
 
 FuncType = Callable[..., Coroutine[Any, Any, web.StreamResponse]]
 
+# models of all the alive validated handlers (used by :py:func:`aiohttp_validator.warmup`)
+registered_models: 'weakref.WeakSet[Type[pydantic.BaseModel]]' = weakref.WeakSet()
+
+
+def register_annotation_models(annotation: Any) -> None:
+    annotation_type = typing.get_origin(annotation) or annotation
+    if inspect.isclass(annotation_type) and issubclass(annotation_type, pydantic.BaseModel):
+        if annotation_type in registered_models:
+            return
+        registered_models.add(annotation_type)
+        for field in annotation_type.model_fields.values():
+            register_annotation_models(field.annotation)
+
+    for arg in typing.get_args(annotation):
+        register_annotation_models(arg)
+
+
+def register_models(params_model: Type[pydantic.BaseModel], annotations: FuncAnnotation) -> None:
+    for annotation in (params_model, annotations.body, annotations.headers, annotations.cookies):
+        register_annotation_models(annotation)
+
 
 def validated(
         config: Optional[pydantic.ConfigDict] = None,
@@ -177,6 +199,7 @@ def validated(
                 __config__=config,
                 **annotations.params,
             )
+        register_models(params_model, annotations)
 
         @ft.wraps(func)
         async def wrapper(request: web.Request, *args: Any, **kwargs: Any) -> web.StreamResponse:
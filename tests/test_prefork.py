@@ -0,0 +1,179 @@
+import gc
+import pathlib
+import weakref
+from typing import Any, List, Optional
+
+import pydantic as pd
+import pytest
+from aiohttp import web
+from aiohttp.pytest_plugin import AiohttpClient
+
+import aiohttp_validator
+from aiohttp_validator import prefork, validator
+
+
+@pytest.fixture(autouse=True)
+def registered_models(monkeypatch: pytest.MonkeyPatch) -> weakref.WeakSet:
+    models = weakref.WeakSet()
+    monkeypatch.setattr(validator, 'registered_models', models)
+
+    return models
+
+
+async def test_warmup(aiohttp_client: AiohttpClient, registered_models: weakref.WeakSet):
+    class Body(pd.BaseModel):
+        model_config = pd.ConfigDict(defer_build=True)
+
+        field1: int
+
+    class Headers(pd.BaseModel):
+        field1: str
+
+    @validator.validated(config=pd.ConfigDict(defer_build=True))
+    async def test_method(request: web.Request, body: Body, headers: Headers, param1: int):
+        assert body == Body(field1=1)
+        assert param1 == 1
+
+        return web.Response(status=200)
+
+    assert len(registered_models) == 3
+    assert Body in registered_models
+    assert Headers in registered_models
+
+    params_model = next(model for model in registered_models if model not in (Body, Headers))
+    assert Body.__pydantic_complete__ is False
+    assert params_model.__pydantic_complete__ is False
+
+    assert aiohttp_validator.warmup(freeze=False) == 3
+
+    assert Body.__pydantic_complete__ is True
+    assert params_model.__pydantic_complete__ is True
+
+    app = web.Application()
+    app.router.add_post('/', test_method)
+
+    client = await aiohttp_client(app)
+
+    resp = await client.post('/', params=dict(param1='1'), json=dict(field1=1), headers=dict(field1='1'))
+    assert resp.status == 200
+
+
+def test_warmup_unresolved_reference(registered_models: weakref.WeakSet):
+    class Body(pd.BaseModel):
+        child: 'Child'  # noqa: F821
+
+    class Headers(pd.BaseModel):
+        field1: str
+
+    @validator.validated()
+    async def test_method(request: web.Request, body: Body, headers: Headers):
+        return web.Response(status=200)
+
+    try:
+        with pytest.warns(RuntimeWarning, match='Body'):
+            assert aiohttp_validator.warmup() == 2
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
+    assert Body.__pydantic_complete__ is False
+
+
+def test_warmup_validation_error(registered_models: weakref.WeakSet):
+    class Body(pd.BaseModel):
+        field1: int
+
+        @pd.model_validator(mode='before')
+        @classmethod
+        def check(cls, data: Any) -> Any:
+            data['field1']  # raises KeyError on empty input
+            return data
+
+    @validator.validated()
+    async def test_method(request: web.Request, body: Body):
+        return web.Response(status=200)
+
+    try:
+        with pytest.warns(RuntimeWarning, match='Body'):
+            assert aiohttp_validator.warmup() == 2
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
+
+def test_warmup_nested_models(registered_models: weakref.WeakSet):
+    class Sub(pd.BaseModel):
+        model_config = pd.ConfigDict(defer_build=True)
+
+        field1: str
+
+    class Item(pd.BaseModel):
+        model_config = pd.ConfigDict(defer_build=True)
+
+        field1: int
+
+    class Headers(pd.BaseModel):
+        model_config = pd.ConfigDict(defer_build=True)
+
+        sub: Optional[Sub] = None
+        items: List[Item] = []
+
+    @validator.validated()
+    async def test_method(request: web.Request, headers: Headers):
+        return web.Response(status=200)
+
+    assert {Sub, Item, Headers} <= set(registered_models)
+    assert Sub.__pydantic_complete__ is False
+    assert Item.__pydantic_complete__ is False
+
+    assert aiohttp_validator.warmup(freeze=False) == 4
+
+    assert Sub.__pydantic_complete__ is True
+    assert Item.__pydantic_complete__ is True
+
+
+def test_warmup_freeze(registered_models: weakref.WeakSet):
+    @validator.validated()
+    async def test_method(request: web.Request, param1: int):
+        return web.Response(status=200)
+
+    try:
+        assert aiohttp_validator.warmup() == 1
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
+
+def test_registered_models_released(registered_models: weakref.WeakSet):
+    class Body(pd.BaseModel):
+        field1: int
+
+    def handler_factory():
+        @validator.validated()
+        async def test_method(request: web.Request, body: Body, param1: int):
+            return web.Response(status=200)
+
+        return test_method
+
+    handlers = [handler_factory() for _ in range(3)]
+    assert len(registered_models) == 4
+
+    del handlers
+    gc.collect()
+    assert list(registered_models) == [Body]
+
+
+def test_memory_usage():
+    usage = aiohttp_validator.memory_usage()
+    if prefork.SMAPS_ROLLUP_PATH.exists():
+        assert usage is not None
+        assert isinstance(usage.shared, int) and usage.shared >= 0
+        assert isinstance(usage.private, int) and usage.private > 0
+    else:
+        assert usage is None
+
+
+def test_memory_usage_unavailable(monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path):
+    monkeypatch.setattr(prefork, 'SMAPS_ROLLUP_PATH', tmp_path / 'smaps_rollup')
+
+    assert aiohttp_validator.memory_usage() is None